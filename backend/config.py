@@ -33,6 +33,16 @@ OPENAI_REQUEST_TIMEOUT_SECONDS: int = _env_int("OPENAI_REQUEST_TIMEOUT_SECONDS",
 DB_CONNECT_TIMEOUT_SECONDS: int = _env_int("DB_CONNECT_TIMEOUT_SECONDS", 10)
 DB_STATEMENT_TIMEOUT_MS: int = _env_int("DB_STATEMENT_TIMEOUT_MS", 30000, minimum=1000)
 REST_DB_TIMEOUT_SECONDS: int = _env_int("REST_DB_TIMEOUT_SECONDS", 30)
+CHART_MAX_POINTS: int = _env_int("CHART_MAX_POINTS", 20, minimum=3)
+DB_POOL_SIZE: int = _env_int("DB_POOL_SIZE", 2)
+DB_POOL_MAX_IDLE_SECONDS: int = _env_int("DB_POOL_MAX_IDLE_SECONDS", 300)
+DB_POOL_VALIDATE_AFTER_SECONDS: int = _env_int("DB_POOL_VALIDATE_AFTER_SECONDS", 5)
+HTTP_KEEPALIVE_SECONDS: int = _env_int("HTTP_KEEPALIVE_SECONDS", 120)
+HEALTH_CHECK_INTERVAL_SECONDS: int = _env_int("HEALTH_CHECK_INTERVAL_SECONDS", 30)
+STT_REQUEST_TIMEOUT_SECONDS: int = _env_int("STT_REQUEST_TIMEOUT_SECONDS", 30)
+STT_SESSION_TTL_SECONDS: int = _env_int("STT_SESSION_TTL_SECONDS", 120)
+STT_MAX_AUDIO_BYTES: int = _env_int("STT_MAX_AUDIO_BYTES", 10 * 1024 * 1024)
+SPECULATIVE_SQL_TTL_SECONDS: int = _env_int("SPECULATIVE_SQL_TTL_SECONDS", 60)
 
 
 def validate_config() -> None:
@@ -1,11 +1,15 @@
 import logging
+import threading
+import time
 from contextlib import contextmanager
 from urllib.parse import quote, unquote, urlsplit, urlunsplit
 
-import httpx
-
 from backend.config import (
     DB_CONNECT_TIMEOUT_SECONDS,
+    DB_POOL_MAX_IDLE_SECONDS,
+    DB_POOL_SIZE,
+    DB_POOL_VALIDATE_AFTER_SECONDS,
+    HTTP_KEEPALIVE_SECONDS,
     REST_DB_TIMEOUT_SECONDS,
     SUPABASE_DB_URL,
     SUPABASE_KEY,
@@ -14,6 +18,11 @@ from backend.config import (
 
 logger = logging.getLogger(__name__)
 
+# Idle direct connections kept open between requests as (connection, released_at)
+_idle_connections: list = []
+_pool_lock = threading.Lock()
+_rest_client = None
+
 
 def has_rest_config() -> bool:
     return bool(SUPABASE_URL and SUPABASE_KEY)
@@ -101,33 +110,111 @@ def get_connection():
             "or configure SUPABASE_URL + SUPABASE_KEY for REST mode."
         ) from exc
 
-    db_url = normalize_direct_db_url()
-    conn = psycopg.connect(db_url, connect_timeout=DB_CONNECT_TIMEOUT_SECONDS)
+    conn = _acquire_connection(psycopg)
     try:
-        with conn.cursor() as cur:
-            cur.execute("SET search_path TO public")
-        conn.commit()
         yield conn
         conn.commit()
     except Exception as e:
-        conn.rollback()
         logger.error(f"Database error, rolling back: {e}")
+        try:
+            conn.rollback()
+        except Exception:
+            conn.close()
         raise
     finally:
+        _release_connection(conn)
+
+
+def _acquire_connection(psycopg):
+    while True:
+        with _pool_lock:
+            if not _idle_connections:
+                break
+            conn, released_at = _idle_connections.pop()
+        idle_for = time.monotonic() - released_at
+        if conn.closed or idle_for >= DB_POOL_MAX_IDLE_SECONDS:
+            conn.close()
+            continue
+        # A server-side drop (pooler timeout, network blip) still reports closed == False
+        if idle_for >= DB_POOL_VALIDATE_AFTER_SECONDS and not _is_alive(conn):
+            conn.close()
+            continue
+        return conn
+
+    db_url = normalize_direct_db_url()
+    conn = psycopg.connect(db_url, connect_timeout=DB_CONNECT_TIMEOUT_SECONDS)
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SET search_path TO public")
+        conn.commit()
+    except Exception:
+        conn.close()
+        raise
+    return conn
+
+
+def _is_alive(conn) -> bool:
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+        conn.rollback()
+        return True
+    except Exception as e:
+        logger.warning(f"Discarding stale pooled DB connection: {e}")
+        return False
+
+
+def _release_connection(conn) -> None:
+    from psycopg.pq import TransactionStatus
+
+    if conn.closed:
+        return
+    if conn.info.transaction_status != TransactionStatus.IDLE:
+        conn.close()
+        return
+    with _pool_lock:
+        if len(_idle_connections) < DB_POOL_SIZE:
+            _idle_connections.append((conn, time.monotonic()))
+            return
+    conn.close()
+
+
+def _get_rest_client():
+    global _rest_client
+    if _rest_client is None:
+        import httpx
+
+        with _pool_lock:
+            if _rest_client is None:
+                _rest_client = httpx.Client(
+                    timeout=REST_DB_TIMEOUT_SECONDS,
+                    limits=httpx.Limits(keepalive_expiry=HTTP_KEEPALIVE_SECONDS),
+                )
+    return _rest_client
+
+
+def close_connections() -> None:
+    global _rest_client
+    with _pool_lock:
+        idle = [conn for conn, _ in _idle_connections]
+        _idle_connections.clear()
+        rest_client, _rest_client = _rest_client, None
+    for conn in idle:
         conn.close()
+    if rest_client is not None:
+        rest_client.close()
 
 
 def check_connection() -> bool:
     try:
         if use_supabase_rest():
-            response = httpx.get(
+            response = _get_rest_client().get(
                 f"{SUPABASE_URL}/rest/v1/customers",
                 headers={
                     "apikey": SUPABASE_KEY,
                     "Authorization": f"Bearer {SUPABASE_KEY}",
                 },
                 params={"limit": 1},
-                timeout=REST_DB_TIMEOUT_SECONDS,
             )
             return response.status_code == 200
 
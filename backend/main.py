@@ -1,12 +1,19 @@
+import asyncio
+import contextlib
 import logging
+import time
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from backend.config import validate_config
-from backend.database.connection import init_database
+from backend.database.connection import close_connections, init_database
 from backend.routes.query import router as query_router
+from backend.services.health_service import refresh_health_status, run_health_prober
+from backend.services.nlp_service import close_client, warm_up_client
+from backend.services.speculative_service import shutdown_speculation
+from backend.services.stt_service import close_stt_client
 
 
 
@@ -20,11 +27,31 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Starting AI Banking Data Assistant...")
+    started = time.perf_counter()
     validate_config()           
     init_database()             
-    logger.info("Startup complete. API is ready.")
+
+    # Warm the DB connection and the OpenRouter keep-alive pool concurrently
+    db_ok, llm_ok = await asyncio.gather(
+        refresh_health_status(),
+        asyncio.to_thread(warm_up_client),
+    )
+    prober = asyncio.create_task(run_health_prober())
+    logger.info(
+        "Startup complete in %.0f ms (database %s, LLM client %s). API is ready.",
+        (time.perf_counter() - started) * 1000,
+        "warm" if db_ok else "unreachable",
+        "warm" if llm_ok else "cold",
+    )
     yield
     logger.info("Shutting down AI Banking Data Assistant.")
+    prober.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await prober
+    shutdown_speculation()
+    await close_stt_client()
+    close_client()
+    close_connections()
 
 app = FastAPI(
     title="AI Banking Data Assistant",
@@ -28,3 +28,12 @@ class QueryResponse(BaseModel):
     row_count: int = 0
     chart_data: Optional[ChartData] = None
     error: Optional[str] = None
+
+
+class SttResponse(BaseModel):
+    session_id: str = ""
+    transcript: str = ""
+    language_code: Optional[str] = None
+    is_final: bool = False
+    stable: bool = False
+    error: Optional[str] = None
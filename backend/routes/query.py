@@ -1,11 +1,14 @@
 import os
 import logging
-from fastapi import APIRouter
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import JSONResponse
 
-from backend.models.schemas import QueryRequest, QueryResponse
-from backend.services.nlp_service import query_to_sql
-from backend.database.connection import check_connection
+from backend.config import STT_MAX_AUDIO_BYTES
+from backend.models.schemas import QueryRequest, QueryResponse, SttResponse
+from backend.services.health_service import get_health_status
+from backend.services.speculative_service import resolve_sql
+from backend.services.stt_service import buffered_audio_bytes, discard_session, process_chunk
 from backend.services.validator import validate_sql, validate_sql_alignment
 from backend.services.db_service import execute_query
 
@@ -19,7 +22,7 @@ async def handle_query(request: QueryRequest) -> QueryResponse:
     logger.info(f"Received query: {request.user_query}")
 
     try:
-        sql = query_to_sql(request.user_query)
+        sql = await resolve_sql(request.user_query)
         logger.info(f"Generated SQL: {sql}")
     except Exception as e:
         logger.error(f"NLP service error: {e}")
@@ -55,13 +58,39 @@ async def handle_query(request: QueryRequest) -> QueryResponse:
     )
 
 
+@router.post("/stt", response_model=SttResponse)
+async def handle_stt(
+    request: Request,
+    session_id: Optional[str] = None,
+    final: bool = True,
+    language_code: Optional[str] = None,
+) -> SttResponse:
+    # Raw audio body rather than multipart, so chunks can be streamed as they are recorded
+    buffered = buffered_audio_bytes(session_id)
+    chunk = bytearray()
+    async for part in request.stream():
+        chunk.extend(part)
+        if buffered + len(chunk) > STT_MAX_AUDIO_BYTES:
+            discard_session(session_id)
+            raise HTTPException(status_code=413, detail="Recording is too long.")
+
+    return await process_chunk(
+        session_id,
+        bytes(chunk),
+        final,
+        content_type=request.headers.get("content-type"),
+        language_code=language_code,
+    )
+
+
 @router.get("/health")
 async def health_check():
-    db_ok = check_connection()
+    db_ok, checked_at = await get_health_status()
     return JSONResponse(content={
         "status": "healthy" if db_ok else "degraded",
         "database": "connected" if db_ok else "unreachable",
-        "api": "running"
+        "api": "running",
+        "checked_at": checked_at.isoformat() if checked_at else None
     })
 
 
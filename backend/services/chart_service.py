@@ -0,0 +1,305 @@
+import logging
+from datetime import datetime
+from typing import Any, Optional
+
+from backend.config import CHART_MAX_POINTS
+from backend.models.schemas import ChartData
+
+logger = logging.getLogger(__name__)
+
+# Postgres type OIDs as reported in cursor.description[i].type_code
+NUMERIC_TYPE_OIDS = {20, 21, 23, 700, 701, 790, 1700}
+TEMPORAL_TYPE_OIDS = {1082, 1114, 1184}
+
+LABEL_KEYWORDS = ["transaction_type", "account_type", "name", "description", "type"]
+VALUE_KEYWORDS = ["amount", "total", "count", "sum", "balance",
+                  "credit", "debit", "revenue", "payment"]
+TEMPORAL_KEYWORDS = ["date", "created_at", "_at", "time", "month", "day", "week", "year"]
+
+OTHER_LABEL = "Other"
+NULL_LABEL = "—"
+
+# Smallest granularity first; seconds are approximate and only used to size buckets
+TIME_GRANULARITIES = [
+    ("hour", 3600),
+    ("day", 86400),
+    ("week", 7 * 86400),
+    ("month", 30 * 86400),
+    ("quarter", 91 * 86400),
+    ("year", 365 * 86400),
+]
+
+CATEGORICAL = "categorical"
+TEMPORAL = "temporal"
+SERIES = "series"
+
+
+def build_chart_data(
+    columns: list[str],
+    type_codes: list[Optional[int]],
+    rows: list[list[Any]],
+    max_points: int = CHART_MAX_POINTS,
+) -> Optional[ChartData]:
+    """Pick label/value columns and reduce the fetched rows to at most ``max_points`` points."""
+    plan = plan_chart(columns, type_codes, rows, max_points)
+    if plan is None:
+        return None
+
+    try:
+        return reduce_rows(plan, rows, max_points)
+    except (TypeError, ValueError) as e:
+        logger.warning(f"Could not build chart data: {e}")
+        return None
+
+
+def plan_chart(
+    columns: list[str],
+    type_codes: list[Optional[int]],
+    rows: list[list[Any]],
+    max_points: int = CHART_MAX_POINTS,
+) -> Optional[tuple[str, Optional[int], int]]:
+    """Return ``(kind, label_idx, value_idx)`` or None when the result cannot be charted."""
+    if not rows or not columns:
+        return None
+
+    if len(rows) == 1 and len(columns) == 1:
+        return None
+
+    col_lower_list = [c.lower() for c in columns]
+    numeric = [_is_numeric_column(i, type_codes, rows) for i in range(len(columns))]
+    temporal = [
+        not numeric[i] and _is_temporal_column(i, col_lower_list[i], type_codes, rows)
+        for i in range(len(columns))
+    ]
+    text = [not numeric[i] and not temporal[i] for i in range(len(columns))]
+
+    value_idx = _pick_value_column(col_lower_list, numeric)
+    if value_idx is None:
+        return None
+
+    keyword_label_idx = next(
+        (i for i, col_lower in enumerate(col_lower_list)
+         if text[i] and any(kw in col_lower for kw in LABEL_KEYWORDS)),
+        None,
+    )
+    temporal_idx = next((i for i, is_temporal in enumerate(temporal) if is_temporal), None)
+    text_idx = next((i for i, is_text in enumerate(text) if is_text), None)
+
+    # A short result reads best one bar per named row; a long one as a trend over time
+    if keyword_label_idx is not None and len(rows) <= max_points:
+        return CATEGORICAL, keyword_label_idx, value_idx
+    if temporal_idx is not None:
+        return TEMPORAL, temporal_idx, value_idx
+    if keyword_label_idx is not None:
+        return CATEGORICAL, keyword_label_idx, value_idx
+    if text_idx is not None:
+        return CATEGORICAL, text_idx, value_idx
+    return SERIES, None, value_idx
+
+
+def reduce_rows(
+    plan: tuple[str, Optional[int], int],
+    rows: list[list[Any]],
+    max_points: int = CHART_MAX_POINTS,
+) -> Optional[ChartData]:
+    kind, label_idx, value_idx = plan
+
+    if kind == CATEGORICAL:
+        pairs = [(_label(row[label_idx]), _to_float(row[value_idx])) for row in rows]
+        if len(pairs) <= max_points:
+            return ChartData(type="bar", labels=[p[0] for p in pairs], values=[p[1] for p in pairs])
+        totals: dict[str, float] = {}
+        for label, value in pairs:
+            totals[label] = totals.get(label, 0.0) + value
+        return _top_n_with_other(sorted(totals.items(), key=lambda p: p[1], reverse=True), max_points)
+
+    if kind == TEMPORAL:
+        points = []
+        for row in rows:
+            moment = _to_datetime(row[label_idx])
+            if moment is not None:
+                points.append((moment, _to_float(row[value_idx]), str(row[label_idx])))
+        if not points:
+            return None
+        if len(points) <= max_points:
+            # Rows may be ordered by something other than time; a line must run forwards
+            points.sort(key=lambda p: p[0])
+            return ChartData(type="line", labels=[p[2] for p in points], values=[p[1] for p in points])
+        granularity = _pick_granularity(min(p[0] for p in points), max(p[0] for p in points), max_points)
+        buckets: dict[datetime, float] = {}
+        for moment, value, _ in points:
+            bucket = _truncate(moment, granularity)
+            buckets[bucket] = buckets.get(bucket, 0.0) + value
+        return _time_buckets_to_chart(sorted(buckets.items()), granularity, max_points)
+
+    values = [_to_float(row[value_idx]) for row in rows]
+    indexed = lttb(list(enumerate(values, start=1)), max_points)
+    return ChartData(
+        type="line",
+        labels=[f"Row {int(x)}" for x, _ in indexed],
+        values=[y for _, y in indexed],
+    )
+
+
+def lttb(points: list[tuple[float, float]], threshold: int) -> list[tuple[float, float]]:
+    """Largest-Triangle-Three-Buckets downsampling; keeps first/last points and the visual shape."""
+    if threshold >= len(points):
+        return list(points)
+    if threshold < 3:
+        return [points[0], points[-1]][:threshold]
+
+    sampled = [points[0]]
+    bucket_size = (len(points) - 2) / (threshold - 2)
+    a = 0
+
+    for i in range(threshold - 2):
+        avg_start = int((i + 1) * bucket_size) + 1
+        avg_end = min(int((i + 2) * bucket_size) + 1, len(points))
+        avg_range = points[avg_start:avg_end] or [points[-1]]
+        avg_x = sum(p[0] for p in avg_range) / len(avg_range)
+        avg_y = sum(p[1] for p in avg_range) / len(avg_range)
+
+        range_start = int(i * bucket_size) + 1
+        range_end = int((i + 1) * bucket_size) + 1
+        ax, ay = points[a]
+        max_area = -1.0
+        next_a = range_start
+        for j in range(range_start, range_end):
+            area = abs((ax - avg_x) * (points[j][1] - ay) - (ax - points[j][0]) * (avg_y - ay))
+            if area > max_area:
+                max_area = area
+                next_a = j
+        sampled.append(points[next_a])
+        a = next_a
+
+    sampled.append(points[-1])
+    return sampled
+
+
+def _top_n_with_other(totals: list[tuple[str, float]], max_points: int) -> ChartData:
+    if len(totals) <= max_points:
+        return ChartData(
+            type="bar",
+            labels=[label for label, _ in totals],
+            values=[value for _, value in totals],
+        )
+    kept = totals[:max_points - 1]
+    other = sum(value for _, value in totals[max_points - 1:])
+    return ChartData(
+        type="bar",
+        labels=[label for label, _ in kept] + [OTHER_LABEL],
+        values=[value for _, value in kept] + [other],
+    )
+
+
+def _time_buckets_to_chart(
+    buckets: list[tuple[datetime, float]], granularity: str, max_points: int
+) -> ChartData:
+    # Calendar buckets can overshoot the estimate by one or two; thin them without losing the ends
+    points = lttb([(b.timestamp(), v) for b, v in buckets], max_points)
+    by_timestamp = {b.timestamp(): b for b, _ in buckets}
+    return ChartData(
+        type="line",
+        labels=[_format_bucket(by_timestamp[x], granularity) for x, _ in points],
+        values=[y for _, y in points],
+    )
+
+
+def _pick_granularity(start: datetime, end: datetime, max_points: int) -> str:
+    span = max((end - start).total_seconds(), 0)
+    for name, seconds in TIME_GRANULARITIES:
+        if span / seconds < max_points:
+            return name
+    return TIME_GRANULARITIES[-1][0]
+
+
+def _truncate(moment: datetime, granularity: str) -> datetime:
+    if granularity == "hour":
+        return moment.replace(minute=0, second=0, microsecond=0)
+    day = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+    if granularity == "day":
+        return day
+    if granularity == "week":
+        return datetime.fromordinal(day.toordinal() - day.weekday()).replace(tzinfo=moment.tzinfo)
+    if granularity == "month":
+        return day.replace(day=1)
+    if granularity == "quarter":
+        return day.replace(month=(day.month - 1) // 3 * 3 + 1, day=1)
+    return day.replace(month=1, day=1)
+
+
+def _format_bucket(moment: datetime, granularity: str) -> str:
+    if granularity == "hour":
+        return moment.strftime("%Y-%m-%d %H:00")
+    if granularity in ("day", "week"):
+        return moment.strftime("%Y-%m-%d")
+    if granularity == "month":
+        return moment.strftime("%Y-%m")
+    if granularity == "quarter":
+        return f"{moment.year}-Q{(moment.month - 1) // 3 + 1}"
+    return str(moment.year)
+
+
+def _pick_value_column(col_lower_list: list[str], numeric: list[bool]) -> Optional[int]:
+    candidates = [i for i, is_numeric in enumerate(numeric)
+                  if is_numeric and not _is_id_column(col_lower_list[i])]
+    for i in candidates:
+        if any(kw in col_lower_list[i] for kw in VALUE_KEYWORDS):
+            return i
+    return candidates[0] if candidates else None
+
+
+def _is_id_column(col_lower: str) -> bool:
+    return col_lower == "id" or col_lower.endswith("_id")
+
+
+def _type_code(type_codes: list[Optional[int]], idx: int) -> Optional[int]:
+    return type_codes[idx] if idx < len(type_codes) else None
+
+
+def _is_numeric_column(idx: int, type_codes: list[Optional[int]], rows: list[list[Any]]) -> bool:
+    type_code = _type_code(type_codes, idx)
+    if type_code is not None:
+        return type_code in NUMERIC_TYPE_OIDS
+    values = [row[idx] for row in rows if row[idx] is not None]
+    return bool(values) and all(
+        (isinstance(v, (int, float)) and not isinstance(v, bool)) or
+        (isinstance(v, str) and _is_numeric(v)) for v in values
+    )
+
+
+def _is_temporal_column(idx: int, col_lower: str, type_codes: list[Optional[int]], rows: list[list[Any]]) -> bool:
+    type_code = _type_code(type_codes, idx)
+    if type_code is not None:
+        return type_code in TEMPORAL_TYPE_OIDS
+    if not any(kw in col_lower for kw in TEMPORAL_KEYWORDS):
+        return False
+    values = [row[idx] for row in rows if row[idx] is not None]
+    return bool(values) and all(_to_datetime(v) is not None for v in values)
+
+
+def _to_datetime(value: Any) -> Optional[datetime]:
+    if isinstance(value, datetime):
+        return value
+    if hasattr(value, "toordinal"):
+        return datetime.fromordinal(value.toordinal())
+    try:
+        return datetime.fromisoformat(str(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_float(value: Any) -> float:
+    return float(value) if value is not None else 0.0
+
+
+def _label(value: Any) -> str:
+    return str(value) if value is not None else NULL_LABEL
+
+
+def _is_numeric(value: str) -> bool:
+    try:
+        float(value)
+        return True
+    except (ValueError, TypeError):
+        return False
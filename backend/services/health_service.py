@@ -0,0 +1,35 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Optional
+
+from backend.config import HEALTH_CHECK_INTERVAL_SECONDS
+from backend.database.connection import check_connection
+
+logger = logging.getLogger(__name__)
+
+_db_ok: Optional[bool] = None
+_checked_at: Optional[datetime] = None
+
+
+async def refresh_health_status() -> bool:
+    global _db_ok, _checked_at
+    db_ok = await asyncio.to_thread(check_connection)
+    _db_ok, _checked_at = db_ok, datetime.now(timezone.utc)
+    return db_ok
+
+
+async def get_health_status() -> tuple[bool, Optional[datetime]]:
+    """Return the last probed DB status, probing once if the prober has not run yet."""
+    if _db_ok is None:
+        await refresh_health_status()
+    return bool(_db_ok), _checked_at
+
+
+async def run_health_prober(interval: int = HEALTH_CHECK_INTERVAL_SECONDS) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await refresh_health_status()
+        except Exception as e:
+            logger.error(f"Background health probe failed: {e}")
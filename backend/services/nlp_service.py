@@ -1,10 +1,10 @@
 import re
 import logging
-import openai
-from openai import OpenAI
+import threading
 import time
 
 from backend.config import (
+    HTTP_KEEPALIVE_SECONDS,
     OPENROUTER_API_KEY,
     OPENROUTER_MODEL,
     OPENAI_BASE_URL,
@@ -16,6 +16,11 @@ from backend.services.validator import clean_sql
 
 logger = logging.getLogger(__name__)
 
+# openai is imported lazily: it dominates backend import time on a cold start
+_client = None
+_http_client = None
+_client_lock = threading.Lock()
+
 FREE_MODEL_FALLBACKS = [
     "arcee-ai/arcee-prism:free",           
     "stepfun-ai/step-3.5-flash:free",      
@@ -83,18 +88,55 @@ Rules:
 Question: {user_query}"""
 
 
-def query_to_sql(user_query: str) -> str:
-    prompt = build_prompt(user_query)
+def get_client():
+    global _client, _http_client
+    if _client is None:
+        import httpx
+        from openai import OpenAI
+
+        with _client_lock:
+            if _client is None:
+                _http_client = httpx.Client(
+                    timeout=OPENAI_REQUEST_TIMEOUT_SECONDS,
+                    limits=httpx.Limits(keepalive_expiry=HTTP_KEEPALIVE_SECONDS),
+                )
+                _client = OpenAI(
+                    api_key=OPENROUTER_API_KEY,
+                    base_url=OPENAI_BASE_URL,
+                    timeout=OPENAI_REQUEST_TIMEOUT_SECONDS,
+                    max_retries=0,
+                    http_client=_http_client,
+                )
+    return _client
+
+
+def warm_up_client() -> bool:
+    """Build the client and open a keep-alive TLS connection to OpenRouter."""
+    try:
+        get_client()
+        _http_client.head(f"{OPENAI_BASE_URL}/models")
+        return True
+    except Exception as e:
+        logger.warning(f"OpenRouter warm-up failed: {e}")
+        return False
+
 
-    client = OpenAI(
-        api_key=OPENROUTER_API_KEY,
-        base_url=OPENAI_BASE_URL,
-        timeout=OPENAI_REQUEST_TIMEOUT_SECONDS,
-        max_retries=0,
-    )
+def close_client() -> None:
+    global _client, _http_client
+    with _client_lock:
+        http_client, _client, _http_client = _http_client, None, None
+    if http_client is not None:
+        http_client.close()
+
+
+def query_to_sql(user_query: str, use_fallbacks: bool = True) -> str:
+    import openai
+
+    prompt = build_prompt(user_query)
+    client = get_client()
 
     # Put .env model first, deduplicate
-    models_to_try = list(dict.fromkeys([OPENROUTER_MODEL] + FREE_MODEL_FALLBACKS))
+    models_to_try = list(dict.fromkeys([OPENROUTER_MODEL] + (FREE_MODEL_FALLBACKS if use_fallbacks else [])))
 
     last_error = None
 
@@ -0,0 +1,86 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from backend.config import SPECULATIVE_SQL_TTL_SECONDS
+from backend.services.nlp_service import query_to_sql
+
+logger = logging.getLogger(__name__)
+
+MAX_PENDING = 32
+
+# STT session id -> (normalized user query, SQL generation future, started_at)
+_pending: dict[str, tuple[str, Future, float]] = {}
+_executor = None
+
+
+def normalize_query(user_query: str) -> str:
+    return " ".join(user_query.lower().split()).rstrip("?.! ")
+
+
+def speculate_sql(session_id: str, user_query: str) -> None:
+    """Start generating SQL for a query the user is likely to submit next.
+
+    At most one job runs per session: a newer transcript replaces an earlier
+    guess only if that guess has finished or not started yet. Speculative jobs
+    try just the configured model, so a wrong guess cannot walk the fallback
+    list and spend the rate limit the real /query needs.
+    """
+    key = normalize_query(user_query)
+    if not key or len(user_query) > 500:
+        return
+
+    _evict_expired()
+    current = _pending.get(session_id)
+    if current is not None:
+        if current[0] == key:
+            return
+        if not current[1].done() and not current[1].cancel():
+            return
+    elif len(_pending) >= MAX_PENDING:
+        return
+
+    logger.info(f"Speculatively generating SQL for: {user_query}")
+    _pending[session_id] = (key, _get_executor().submit(query_to_sql, user_query, False), time.monotonic())
+
+
+async def resolve_sql(user_query: str) -> str:
+    """Return SQL for ``user_query``, reusing a speculative generation when one matches."""
+    _evict_expired()
+    key = normalize_query(user_query)
+    session_id = next((sid for sid, entry in _pending.items() if entry[0] == key), None)
+    if session_id is not None:
+        future = _pending.pop(session_id)[1]
+        # Still queued: generating it here is faster than waiting behind other work
+        if not future.cancel():
+            try:
+                sql = await asyncio.wrap_future(future)
+                logger.info("Using speculatively generated SQL.")
+                return sql
+            except Exception as e:
+                logger.warning(f"Speculative SQL generation failed, retrying: {e}")
+    return await asyncio.to_thread(query_to_sql, user_query)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="speculative-sql")
+    return _executor
+
+
+def _evict_expired() -> None:
+    now = time.monotonic()
+    for session_id, (_, future, started_at) in list(_pending.items()):
+        if now - started_at > SPECULATIVE_SQL_TTL_SECONDS:
+            _pending.pop(session_id, None)
+            future.cancel()
+
+
+def shutdown_speculation() -> None:
+    global _executor
+    _pending.clear()
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
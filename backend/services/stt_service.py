@@ -0,0 +1,197 @@
+import asyncio
+import logging
+import time
+import uuid
+from typing import Optional
+
+from backend.config import (
+    HTTP_KEEPALIVE_SECONDS,
+    SARVAM_API_KEY,
+    SARVAM_STT_ENDPOINT,
+    STT_REQUEST_TIMEOUT_SECONDS,
+    STT_SESSION_TTL_SECONDS,
+)
+from backend.models.schemas import SttResponse
+from backend.services.speculative_service import speculate_sql
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONTENT_TYPE = "audio/wav"
+
+_client = None
+# session_id -> in-progress recording, see _new_session()
+_sessions: dict[str, dict] = {}
+
+
+class SttError(Exception):
+    pass
+
+
+def _get_client():
+    global _client
+    if _client is None:
+        import httpx
+
+        _client = httpx.AsyncClient(
+            timeout=STT_REQUEST_TIMEOUT_SECONDS,
+            limits=httpx.Limits(keepalive_expiry=HTTP_KEEPALIVE_SECONDS),
+        )
+    return _client
+
+
+async def close_stt_client() -> None:
+    global _client
+    client, _client = _client, None
+    _sessions.clear()
+    if client is not None:
+        await client.aclose()
+
+
+async def transcribe(audio: bytes, content_type: str, language_code: Optional[str] = None) -> tuple[str, Optional[str]]:
+    """Send a complete audio clip to the STT endpoint and return ``(transcript, language_code)``."""
+    if not SARVAM_API_KEY:
+        raise SttError("Sarvam AI API key is not configured.")
+
+    data = {"language_code": language_code} if language_code else {}
+    try:
+        response = await _get_client().post(
+            SARVAM_STT_ENDPOINT,
+            headers={"api-subscription-key": SARVAM_API_KEY},
+            files={"file": (_filename(content_type), audio, content_type)},
+            data=data,
+        )
+    except Exception as e:
+        raise SttError(f"Network error when calling STT API: {e}") from e
+
+    if response.status_code != 200:
+        raise SttError(f"STT API failed: {response.status_code} {response.reason_phrase}")
+
+    try:
+        result = response.json()
+    except ValueError as e:
+        raise SttError("Non-JSON response from STT API.") from e
+    if not isinstance(result, dict) or "transcript" not in result:
+        raise SttError("API response missing 'transcript' field.")
+
+    return str(result["transcript"] or "").strip(), result.get("language_code") or language_code
+
+
+async def process_chunk(
+    session_id: Optional[str],
+    chunk: bytes,
+    final: bool,
+    content_type: Optional[str] = None,
+    language_code: Optional[str] = None,
+) -> SttResponse:
+    """Append ``chunk`` to the session's recording and transcribe everything received so far.
+
+    Chunks are MediaRecorder slices, so only the accumulated prefix is a playable
+    clip. Once two consecutive partial transcripts agree (or the recording is
+    final) the transcript is treated as stable and SQL generation starts for it.
+    A partial that arrives while another transcription for the session is in
+    flight is only buffered; the next request picks its audio up. Callers
+    enforce the size limit while reading, see ``buffered_audio_bytes()``.
+    """
+    _evict_expired()
+    session = _sessions.get(session_id) if session_id else None
+    if session is None:
+        session_id = session_id or uuid.uuid4().hex
+        session = _new_session(content_type)
+        _sessions[session_id] = session
+
+    if not final and session["lock"].locked():
+        session["audio"].extend(chunk)
+        session["updated_at"] = time.monotonic()
+        return SttResponse(
+            session_id=session_id,
+            transcript=session["transcript"],
+            language_code=session["language_code"],
+        )
+
+    async with session["lock"]:
+        session["audio"].extend(chunk)
+        session["updated_at"] = time.monotonic()
+        if final:
+            _sessions.pop(session_id, None)
+
+        if not session["audio"]:
+            return SttResponse(session_id=session_id, is_final=final, error="No audio received." if final else None)
+        if final and session["transcribed_bytes"] == len(session["audio"]):
+            # The last partial already covered every byte; don't pay for the same clip twice
+            if session["transcript"] and _is_english(session["language_code"]):
+                speculate_sql(session_id, session["transcript"])
+            return SttResponse(
+                session_id=session_id,
+                transcript=session["transcript"],
+                language_code=session["language_code"],
+                is_final=True,
+                stable=True,
+            )
+
+        audio = bytes(session["audio"])
+        try:
+            transcript, detected = await transcribe(audio, session["content_type"], language_code)
+        except SttError as e:
+            if final:
+                logger.error(f"STT failed: {e}")
+                return SttResponse(session_id=session_id, is_final=True, error=str(e))
+            # Partial transcripts are best effort; a short prefix may not decode yet
+            logger.warning(f"Partial STT failed: {e}")
+            return SttResponse(
+                session_id=session_id,
+                transcript=session["transcript"],
+                language_code=session["language_code"],
+            )
+
+        stable = final or (bool(transcript) and transcript == session["transcript"])
+        session["transcript"], session["language_code"] = transcript, detected
+        session["transcribed_bytes"] = len(audio)
+        if stable and transcript and _is_english(detected):
+            speculate_sql(session_id, transcript)
+
+        return SttResponse(
+            session_id=session_id,
+            transcript=transcript,
+            language_code=detected,
+            is_final=final,
+            stable=stable,
+        )
+
+
+def buffered_audio_bytes(session_id: Optional[str]) -> int:
+    session = _sessions.get(session_id) if session_id else None
+    return len(session["audio"]) if session is not None else 0
+
+
+def discard_session(session_id: Optional[str]) -> None:
+    if session_id:
+        _sessions.pop(session_id, None)
+
+
+def _new_session(content_type: Optional[str]) -> dict:
+    return {
+        "audio": bytearray(),
+        "content_type": content_type or DEFAULT_CONTENT_TYPE,
+        "transcript": "",
+        "language_code": None,
+        "transcribed_bytes": 0,
+        "updated_at": time.monotonic(),
+        "lock": asyncio.Lock(),
+    }
+
+
+def _evict_expired() -> None:
+    now = time.monotonic()
+    for session_id, session in list(_sessions.items()):
+        if now - session["updated_at"] > STT_SESSION_TTL_SECONDS:
+            _sessions.pop(session_id, None)
+
+
+def _filename(content_type: str) -> str:
+    subtype = content_type.split(";")[0].split("/")[-1].strip() or "wav"
+    return f"recording.{subtype}"
+
+
+def _is_english(language_code: Optional[str]) -> bool:
+    # Non-English transcripts are translated before /query, so SQL for them would never be reused
+    return bool(language_code) and language_code.lower().startswith("en")
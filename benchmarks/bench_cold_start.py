@@ -0,0 +1,90 @@
+"""Cold-start benchmark: backend import time, lifespan warm-up and first-request latency.
+
+Run from the repository root with the same environment (.env) as the server:
+
+    python benchmarks/bench_cold_start.py
+    python benchmarks/bench_cold_start.py --runs 10 --query "total balance by account type"
+
+Every run uses a fresh interpreter so nothing is cached between measurements.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_SNIPPET = """
+import json, sys, time
+started = time.perf_counter()
+import backend.main
+print(json.dumps({
+    "import_ms": (time.perf_counter() - started) * 1000,
+    "openai_imported": "openai" in sys.modules,
+}))
+"""
+
+REQUEST_SNIPPET = """
+import json, logging, sys, time
+logging.disable(logging.CRITICAL)
+started = time.perf_counter()
+from backend.main import app
+from fastapi.testclient import TestClient
+import_ms = (time.perf_counter() - started) * 1000
+
+result = {"import_ms": import_ms}
+started = time.perf_counter()
+with TestClient(app) as client:
+    result["startup_ms"] = (time.perf_counter() - started) * 1000
+    for name in ("first_health_ms", "second_health_ms"):
+        started = time.perf_counter()
+        client.get("/health")
+        result[name] = (time.perf_counter() - started) * 1000
+    query = sys.argv[1] if len(sys.argv) > 1 else ""
+    if query:
+        for name in ("first_query_ms", "second_query_ms"):
+            started = time.perf_counter()
+            client.post("/query", json={"user_query": query})
+            result[name] = (time.perf_counter() - started) * 1000
+print(json.dumps(result))
+"""
+
+
+def _run(snippet: str, *args: str) -> dict:
+    completed = subprocess.run(
+        [sys.executable, "-c", snippet, *args],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def _report(samples: list[dict]) -> None:
+    for key in samples[0]:
+        values = [s[key] for s in samples]
+        if isinstance(values[0], bool):
+            print(f"{key:>20}: {values[0]}")
+        else:
+            print(f"{key:>20}: median {statistics.median(values):8.1f} ms   "
+                  f"min {min(values):8.1f} ms   max {max(values):8.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--query", default="", help="also time the first and second POST /query")
+    args = parser.parse_args()
+
+    print(f"Import only ({args.runs} runs)")
+    _report([_run(IMPORT_SNIPPET) for _ in range(args.runs)])
+
+    print(f"\nStartup and first requests ({args.runs} runs)")
+    _report([_run(REQUEST_SNIPPET, args.query) for _ in range(args.runs)])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Local stand-in for the Sarvam speech-to-text API, for exercising POST /stt offline.
+
+The transcript grows with the size of the uploaded audio, so streamed chunks
+produce growing partial transcripts that stabilize once the sentence is complete:
+
+    python benchmarks/stub_stt_server.py --port 8765 --latency-ms 300
+    SARVAM_API_KEY=stub SARVAM_STT_ENDPOINT=http://127.0.0.1:8765/speech-to-text \\
+        uvicorn backend.main:app --port 8000
+
+    curl -s -X POST "http://127.0.0.1:8000/stt?final=false" \\
+        -H "Content-Type: audio/wav" --data-binary @chunk1.wav
+"""
+import argparse
+import json
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SENTENCE = "show total balance by account type"
+
+
+def make_handler(latency_ms: int, bytes_per_word: int, sentence: str):
+    words = sentence.split()
+
+    class StubSttHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            body = self.rfile.read(length)
+            time.sleep(latency_ms / 1000)
+
+            if not self.headers.get("api-subscription-key"):
+                self._send(401, {"error": "missing api-subscription-key"})
+                return
+
+            word_count = min(len(words), len(body) // bytes_per_word)
+            self._send(200, {
+                "transcript": " ".join(words[:word_count]),
+                "language_code": "en-IN",
+            })
+
+        def _send(self, status: int, payload: dict) -> None:
+            data = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            print(f"stub-stt {self.address_string()} {format % args}")
+
+    return StubSttHandler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=int, default=300)
+    parser.add_argument("--bytes-per-word", type=int, default=4000)
+    parser.add_argument("--sentence", default=SENTENCE)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", args.port),
+        make_handler(args.latency_ms, args.bytes_per_word, args.sentence),
+    )
+    print(f"Stub STT server listening on http://127.0.0.1:{args.port}/speech-to-text")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
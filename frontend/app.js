@@ -438,7 +438,7 @@ function renderResults(data) {
     }
 
     renderTable(data.columns, data.rows);
-    tabChart.style.display = "inline-block";
+    tabChart.style.display = data.chart_data ? "inline-block" : "none";
     switchTab("data");
 }
 
@@ -478,7 +478,7 @@ function buildChartFromData(data) {
         chartInstance = null;
     }
 
-    const chartData = resolveChartData(data.columns, data.rows);
+    const chartData = data.chart_data;
 
     if (!chartData) {
         panelChart.innerHTML = `<p style="color:#7c3aed;padding:40px;text-align:center;font-size:12px;font-family:'DM Mono',monospace;">Chart not available for this result type.</p>`;
@@ -487,7 +487,7 @@ function buildChartFromData(data) {
 
     const ctx = document.getElementById("myChart").getContext("2d");
     chartInstance = new Chart(ctx, {
-        type: "bar",
+        type: chartData.type || "bar",
         data: {
             labels: chartData.labels,
             datasets: [{
@@ -537,53 +537,6 @@ function buildChartFromData(data) {
     });
 }
 
-function resolveChartData(columns, rows) {
-    const col = columns.map(c => c.toLowerCase());
-
-    const numericKeywords = ["amount", "balance", "total", "sum", "count"];
-    const nameKeywords    = ["name", "description"];
-    const typeKeywords    = ["transaction_type", "account_type", "type"];
-
-    let numIdx  = null;
-    let nameIdx = null;
-    let typeIdx = null;
-
-    for (let i = 0; i < col.length; i++) {
-        if (numIdx  === null && numericKeywords.some(k => col[i].includes(k))) numIdx  = i;
-        if (nameIdx === null && nameKeywords.some(k => col[i].includes(k)))    nameIdx = i;
-        if (typeIdx === null && typeKeywords.some(k => col[i].includes(k)))    typeIdx = i;
-    }
-
-    if (numIdx === null) {
-        for (let i = 0; i < col.length; i++) {
-            if (rows.every(r => r[i] !== null && !isNaN(Number(r[i])))) { numIdx = i; break; }
-        }
-    }
-
-    if (numIdx === null) return null;
-
-    let lblIdx = null;
-    if (nameIdx !== null) {
-        lblIdx = nameIdx;
-    } else if (typeIdx !== null) {
-        lblIdx = typeIdx;
-    } else {
-        for (let i = 0; i < col.length; i++) {
-            if (i !== numIdx && rows.every(r => typeof r[i] === "string" || r[i] === null)) {
-                lblIdx = i; break;
-            }
-        }
-    }
-
-    const labels = lblIdx !== null
-        ? rows.map(r => String(r[lblIdx] ?? "—"))
-        : rows.map((_, i) => `Row ${i + 1}`);
-
-    const values = rows.map(r => { const v = parseFloat(r[numIdx]); return isNaN(v) ? 0 : v; });
-
-    return { labels, values };
-}
-
 function renderSingleValue(label, value) {
     panelData.innerHTML = `
         <div class="single-value">
@@ -14,11 +14,17 @@ let sourceNode;
 let silenceCheckInterval;
 let silenceStartTime = null;
 let recordingStartTime = null;
+let sttSessionId = null;
+let sttPendingChunks = [];
+let sttUploadInFlight = null;
+let sttStreamFailed = false;
+let sttStreamLanguage = null;
 
 const SILENCE_THRESHOLD_RMS = 0.02;
 const SILENCE_DURATION_MS = 1800;
 const INITIAL_SPEECH_GRACE_MS = 1200;
 const SILENCE_CHECK_INTERVAL_MS = 150;
+const STT_CHUNK_INTERVAL_MS = 1000;
 const DEFAULT_STT_FALLBACK_LANGUAGES = [
     "te-IN", "hi-IN", "ta-IN", "kn-IN", "ml-IN", "bn-IN", "en-IN"
 ];
@@ -52,10 +58,19 @@ async function startRecording() {
         mediaRecorder = new MediaRecorder(stream);
         silenceStartTime = null;
         recordingStartTime = Date.now();
-
-        mediaRecorder.addEventListener("dataavailable", event => audioChunks.push(event.data));
+        sttSessionId = null;
+        sttPendingChunks = [];
+        sttUploadInFlight = null;
+        sttStreamFailed = false;
+        sttStreamLanguage = getConfiguredSttLanguage(getSarvamConfig() || {});
+
+        mediaRecorder.addEventListener("dataavailable", event => {
+            audioChunks.push(event.data);
+            streamChunkToSTT(event.data);
+        });
         mediaRecorder.addEventListener("stop", handleRecordingStop);
-        mediaRecorder.start();
+        // Timesliced recording lets the backend transcribe while the user is still speaking
+        mediaRecorder.start(STT_CHUNK_INTERVAL_MS);
         startSilenceDetection(stream);
         updateUIRecording(true);
     } catch (err) {
@@ -168,23 +183,72 @@ function releaseMicrophone() {
 
 // --- API Communication ---
 
+function streamChunkToSTT(chunk) {
+    if (!chunk || !chunk.size || sttStreamFailed) return;
+
+    sttPendingChunks.push(chunk);
+    if (!sttUploadInFlight) sttUploadInFlight = flushSTTChunks();
+}
+
+// Slices recorded while an upload is in flight go up together in the next request,
+// so a slow STT round-trip never builds a queue of stale partials.
+async function flushSTTChunks() {
+    try {
+        while (sttPendingChunks.length && isRecording && !sttStreamFailed) {
+            const body = new Blob(sttPendingChunks.splice(0));
+            const result = await postAudioToSTT(body, {
+                session_id: sttSessionId, final: false, language_code: sttStreamLanguage
+            });
+            sttSessionId = result.session_id || sttSessionId;
+            if (isRecording && result.transcript) setVoiceStatus(`🎙 "${result.transcript}"`, false);
+        }
+    } catch (err) {
+        console.warn("Streaming STT unavailable, will upload the full recording:", err);
+        sttStreamFailed = true;
+    } finally {
+        sttUploadInFlight = null;
+    }
+}
+
+async function finishSTTStream() {
+    if (sttUploadInFlight) await sttUploadInFlight;
+    const remaining = sttPendingChunks.splice(0);
+    if (!sttSessionId || sttStreamFailed) return null;
+
+    try {
+        const result = await postAudioToSTT(remaining.length ? new Blob(remaining) : null, {
+            session_id: sttSessionId, final: true, language_code: sttStreamLanguage
+        });
+        if (result.error || !result.transcript || !result.transcript.trim()) return null;
+        return {
+            text: result.transcript.trim(),
+            language: normalizeLanguageCode(result.language_code) || "en-IN"
+        };
+    } catch (err) {
+        if (err.code === "network") throw err;
+        return null;
+    } finally {
+        sttSessionId = null;
+    }
+}
+
 async function sendToSTT(audioBlob) {
     setVoiceStatus("Converting speech to text...", false);
 
-    const config = getSarvamConfig();
-    if (!config || !config.API_KEY || !config.STT_ENDPOINT) {
-        throw new Error("Sarvam AI API key or STT endpoint is not configured.");
-    }
+    const streamed = await finishSTTStream();
+    if (streamed) return streamed;
+
+    const config = getSarvamConfig() || {};
 
-    const configuredInputLanguage = (config.STT_INPUT_LANGUAGE || "auto").trim();
-    const attemptLanguages = configuredInputLanguage.toLowerCase() === "auto"
-        ? [null, ...getSttFallbackLanguages(config)]
-        : [configuredInputLanguage];
+    const configuredInputLanguage = getConfiguredSttLanguage(config);
+    const attemptLanguages = configuredInputLanguage
+        ? [configuredInputLanguage]
+        : [null, ...getSttFallbackLanguages(config)];
 
     let lastError = null;
     for (const language of attemptLanguages) {
         try {
-            const result = await requestSTT(audioBlob, language, config);
+            const result = await requestSTT(audioBlob, language);
             const detectedLanguage = normalizeLanguageCode(result.language_code);
             const resolvedLanguage = detectedLanguage || normalizeLanguageCode(language) || "en-IN";
             return { text: result.transcript.trim(), language: resolvedLanguage };
@@ -201,17 +265,31 @@ async function sendToSTT(audioBlob) {
     throw new Error("Could not transcribe audio. Please try again.");
 }
 
-async function requestSTT(audioBlob, language, config) {
-    const formData = new FormData();
-    formData.append("file", audioBlob, "recording.wav");
-    if (language) formData.append("language_code", language);
+async function requestSTT(audioBlob, language) {
+    const result = await postAudioToSTT(audioBlob, { final: true, language_code: language });
+
+    if (result.error) {
+        const err = new Error(result.error); err.code = "stt"; throw err;
+    }
+    if (!result.transcript || !result.transcript.trim()) {
+        const err = new Error("No speech detected. Please try again."); err.code = "empty_transcript"; throw err;
+    }
+
+    return result;
+}
+
+async function postAudioToSTT(audioBlob, params) {
+    const query = new URLSearchParams();
+    Object.entries(params).forEach(([key, value]) => {
+        if (value !== null && value !== undefined) query.append(key, String(value));
+    });
 
     let response;
     try {
-        response = await fetch(config.STT_ENDPOINT, {
+        response = await fetch(`${API_URL}/stt?${query}`, {
             method: "POST",
-            headers: { "api-subscription-key": config.API_KEY },
-            body: formData
+            headers: { "Content-Type": "audio/wav" },
+            body: audioBlob || new Blob([])
         });
     } catch (err) {
         const error = new Error("Network error when calling STT API.");
@@ -219,7 +297,6 @@ async function requestSTT(audioBlob, language, config) {
         throw error;
     }
 
-    const responseText = await response.text();
     if (!response.ok) {
         const error = new Error(`STT API failed: ${response.status} ${response.statusText}`);
         error.code = "http";
@@ -227,18 +304,8 @@ async function requestSTT(audioBlob, language, config) {
         throw error;
     }
 
-    let result;
-    try { result = JSON.parse(responseText); }
+    try { return await response.json(); }
     catch (e) { const err = new Error("Non-JSON response from STT API."); err.code = "invalid_json"; throw err; }
-
-    if (!result || typeof result.transcript === 'undefined') {
-        const err = new Error("API response missing 'transcript' field."); err.code = "invalid_payload"; throw err;
-    }
-    if (!result.transcript.trim()) {
-        const err = new Error("No speech detected. Please try again."); err.code = "empty_transcript"; throw err;
-    }
-
-    return result;
 }
 
 function getSarvamConfig() {
@@ -246,6 +313,11 @@ function getSarvamConfig() {
     return SARVAM_AI_CONFIG;
 }
 
+function getConfiguredSttLanguage(config) {
+    const language = (config.STT_INPUT_LANGUAGE || "auto").trim();
+    return language.toLowerCase() === "auto" ? null : language;
+}
+
 function getSttFallbackLanguages(config) {
     if (Array.isArray(config.STT_FALLBACK_LANGUAGES) && config.STT_FALLBACK_LANGUAGES.length > 0)
         return config.STT_FALLBACK_LANGUAGES.filter(Boolean);